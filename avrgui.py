@@ -327,23 +327,18 @@ class MainWindow(QtWidgets.QWidget):
             self.heads_up_widget,
             self.heads_up_widget.windowTitle(),
         )
-        # self.heads_up_widget.zed_pane.toggle_connection.connect(
-        #     lambda: self.camera_view_widget.change_streaming.emit(
-        #         not self.camera_view_widget.is_connected
-        #     )
-        # )
 
         self.vmc_telemetry_widget.formatted_battery_signal.connect(
-            self.heads_up_widget.telemetry_pane.formatted_battery_signal.emit
+            self.heads_up_widget.telemetry_pane.formatted_battery_signal
         )
         self.vmc_telemetry_widget.formatted_armed_signal.connect(
-            self.heads_up_widget.telemetry_pane.formatted_armed_signal.emit
+            self.heads_up_widget.telemetry_pane.formatted_armed_signal
         )
         self.vmc_telemetry_widget.formatted_mode_signal.connect(
-            self.heads_up_widget.telemetry_pane.formatted_mode_signal.emit
+            self.heads_up_widget.telemetry_pane.formatted_mode_signal
         )
         self.vmc_telemetry_widget.pose_state_signal.connect(
-            self.heads_up_widget.telemetry_pane.pose_state_signal.emit
+            self.heads_up_widget.telemetry_pane.pose_state_signal
         )
 
         self.controller_triangle.connect(
@@ -363,11 +358,8 @@ class MainWindow(QtWidgets.QWidget):
             if self.heads_up_widget.water_pane.log_file is None else
             self.heads_up_widget.water_pane.close_log_file()
         )
-        # self.camera_view_widget.update_frame.connect(
-        #         self.heads_up_widget.zed_pane.update_frame.emit
-        # )
         self.thermal_view_control_widget.viewer.update_frame.connect(
-            self.heads_up_widget.thermal_pane.update_frame.emit
+            self.heads_up_widget.thermal_pane.update_frame
         )
         self.controller_lt.connect(
             self.heads_up_widget.water_pane.trigger_bdu_full
@@ -2,6 +2,7 @@ import json
 from typing import Any, Callable
 
 import roslibpy
+from loguru import logger
 from roslibpy import Ros
 
 
@@ -44,6 +45,10 @@ class Action:
         self._running = False
         self._cancel_requested = False
 
+        # feedback tends to repeat the same payload, so keep the last one parsed
+        self._last_feedback_raw: str | None = None
+        self._last_feedback: dict[str, Any] = {}
+
         cancel = roslibpy.ServiceRequest({'id': self.id})
         self.cancel_client.call(
             cancel
@@ -55,7 +60,7 @@ class Action:
             goal = roslibpy.ServiceRequest({'id': self.id, 'data': data})
             self.goal_client.call(
                 goal,
-                lambda msg: print(f'Sent goal for id: {self.id}')
+                lambda msg: logger.debug('Sent goal for id: {}', self.id)
             )
             self._running = True
 
@@ -65,19 +70,26 @@ class Action:
             self.cancel_client.call(
                 cancel
             )
-            print(f'Sent cancel request for id: {self.id}')
+            logger.debug('Sent cancel request for id: {}', self.id)
         self._running = False
         self._cancel_requested = True
 
     def _feedback(self, msg: Any) -> None:
-        if msg['id'] == self.id:
-            try:
-                data = json.loads(msg['data'])
-            except json.JSONDecodeError:
-                print(f'Failed to decode json for feedback on id: {self.id}')
-            else:
-                if self._running:
-                    self._feedback_callback(data)
+        """
+        Pass the goal's feedback to the feedback callback, parsing the json only when it changed.
+        The callback gets a shallow copy, so nested values are shared with the cache and must not be mutated.
+        """
+        if msg['id'] == self.id and self._running:
+            raw = msg['data']
+            if raw != self._last_feedback_raw:
+                try:
+                    self._last_feedback = json.loads(raw)
+                except json.JSONDecodeError:
+                    logger.error('Failed to decode json for feedback on id: {}', self.id)
+                    return
+                self._last_feedback_raw = raw
+            # the parsed payload is kept for the next message, so the callback gets its own copy of it
+            self._feedback_callback(dict(self._last_feedback))
 
     def _result(self, msg: Any) -> None:
         was_running = self._running
@@ -87,7 +99,7 @@ class Action:
                 try:
                     data = json.loads(msg['data'])
                 except json.JSONDecodeError:
-                    print(f'Failed to decode json for result on id: {self.id}')
+                    logger.error('Failed to decode json for result on id: {}', self.id)
                 else:
                     if was_running:
                         self._result_callback(data)
@@ -14,3 +14,14 @@ def normalize_value(value: float, min_value: float, max_value: float) -> float:
     value_range = max_value - min_value
     relative_value = value - min_value
     return relative_value / value_range
+
+
+def deadzone(value: float | int, min_value: float | int) -> float | int:
+    """
+    Zero a value whose magnitude is within the deadzone, including the edges
+    """
+    number_type = type(value)
+    if -min_value <= value <= min_value:
+        return number_type(0)
+    else:
+        return value
@@ -1,7 +1,15 @@
+import colorsys
+import functools
 from typing import Tuple
 
+import numpy as np
+
 from .calc import normalize_value
 
+# ends of the thermal camera palette, coldest (indigo) to hottest (red)
+THERMAL_COLD_COLOR = (75, 0, 130)
+THERMAL_HOT_COLOR = (255, 0, 0)
+
 
 def smear_color(
         min_color: Tuple[int, int, int],
@@ -19,6 +27,62 @@ def smear_color(
     return tuple(e + s for e, s in zip(min_color, smear))
 
 
+def _hue_to_rgb(v1: np.ndarray, v2: np.ndarray, hue: np.ndarray) -> np.ndarray:
+    hue = hue % 1.0
+    return np.select(
+        [6 * hue < 1, 2 * hue < 1, 3 * hue < 2],
+        [v1 + (v2 - v1) * 6 * hue, v2, v1 + (v2 - v1) * ((2.0 / 3) - hue) * 6],
+        v1
+    )
+
+
+def hsl_to_rgb(hsl: np.ndarray) -> np.ndarray:
+    """
+    Convert an (N, 3) array of HSL colors to RGB, all channels between 0 and 1.
+    """
+    hue, saturation, lightness = hsl[:, 0], hsl[:, 1], hsl[:, 2]
+
+    v2 = np.where(lightness < 0.5, lightness * (1.0 + saturation), (lightness + saturation) - (saturation * lightness))
+    v1 = 2.0 * lightness - v2
+
+    rgb = np.stack(
+        [
+            _hue_to_rgb(v1, v2, hue + (1.0 / 3)),
+            _hue_to_rgb(v1, v2, hue),
+            _hue_to_rgb(v1, v2, hue - (1.0 / 3)),
+        ],
+        axis=1
+    )
+    return np.where(saturation[:, None] == 0, lightness[:, None], rgb)
+
+
+def color_range(
+        start_color: Tuple[int, int, int],
+        end_color: Tuple[int, int, int],
+        steps: int
+) -> np.ndarray:
+    """
+    Build a (steps, 3) uint8 array of colors interpolated in HSL space between two colors.
+    This gives the same colors as `colour.Color.range_to`, without creating an object per step.
+    """
+    start_h, start_l, start_s = colorsys.rgb_to_hls(*(c / 255 for c in start_color))
+    end_h, end_l, end_s = colorsys.rgb_to_hls(*(c / 255 for c in end_color))
+
+    hsl = np.linspace((start_h, start_s, start_l), (end_h, end_s, end_l), steps)
+    return (hsl_to_rgb(hsl) * 255).astype(np.uint8)
+
+
+@functools.cache
+def thermal_palette(depth: int) -> np.ndarray:
+    """
+    Build the (depth, 3) uint8 palette used to color thermal camera frames.
+    The palette is built once per depth and shared, so it is returned read only.
+    """
+    palette = color_range(THERMAL_COLD_COLOR, THERMAL_HOT_COLOR, depth)
+    palette.flags.writeable = False
+    return palette
+
+
 def wrap_text(text: str, color: str) -> str:
     """
     Take a color, and wrap the text with a `span` element for that color.
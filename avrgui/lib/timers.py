@@ -0,0 +1,21 @@
+from typing import Callable
+
+from PySide6 import QtCore
+
+
+class CoalesceTimer(QtCore.QTimer):
+    # Single shot timer that runs a slot at most once per interval, requests in between are merged into that run
+    def __init__(self, interval_ms: int, slot: Callable[[], None], parent: QtCore.QObject) -> None:
+        super().__init__(parent)
+
+        self.setSingleShot(True)
+        self.setInterval(interval_ms)
+        self.timeout.connect(slot)
+
+    @QtCore.Slot()
+    def queue(self) -> None:
+        """
+        Schedule the slot, unless a run is already pending.
+        """
+        if not self.isActive():
+            self.start()
@@ -2,10 +2,13 @@ import contextlib
 import os
 from typing import Optional
 
-from PySide6 import QtGui, QtWidgets
+from PySide6 import QtCore, QtGui, QtWidgets
 
 from .qt_icon import IMG_DIR
 
+# how long a button stays disabled after a press, to coalesce rapid clicks
+BUTTON_DEBOUNCE_MS = 200
+
 
 class IntLineEdit(QtWidgets.QLineEdit):
     def __init__(self, *args, **kwargs) -> None:
@@ -38,6 +41,31 @@ class DisplayLineEdit(QtWidgets.QLineEdit):
         return super().setText(arg__1)
 
 
+class DebounceButton(QtWidgets.QPushButton):
+    # Push button that disables itself for a moment after each press
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+        self.debounce_timer = QtCore.QTimer(self)
+        self.debounce_timer.setSingleShot(True)
+        self.debounce_timer.setInterval(BUTTON_DEBOUNCE_MS)
+        self.debounce_timer.timeout.connect(self.end_debounce)
+
+    def debounce(self) -> bool:
+        """
+        Disable the button for a short time so rapid presses only send one request.
+        Returns False if the button was already pressed within the debounce window.
+        """
+        if not self.isEnabled():
+            return False
+        self.setEnabled(False)
+        self.debounce_timer.start()
+        return True
+
+    def end_debounce(self) -> None:
+        self.setEnabled(True)
+
+
 class StatusLabel(QtWidgets.QWidget):
     # Combination of 2 QLabels to add a status icon
     def __init__(self, text: str):
@@ -5,22 +5,19 @@ import time
 from threading import Thread
 from typing import Any, TextIO
 
-import colour
-import numpy as np
 import roslibpy
 import roslibpy.actionlib
 from PySide6 import QtCore, QtGui, QtWidgets
 from loguru import logger
 
 from .vmc_telemetry import ZEDPositionStatus
-from ..lib import utils
 from ..lib.action import Action
 from ..lib.controller.pythondualsense import Dualsense, BrightnessLevel
-from ..lib.graphics_label import GraphicsLabel
 from .base import BaseTabWidget
 from .connection.rosbridge import RosBridgeClient
 from ..lib.toast import Toast
-from ..lib.utils import constrain
+from ..lib.timers import CoalesceTimer
+from ..lib.widgets import DebounceButton
 
 RED_COLOR = "red"
 LIGHT_BLUE_COLOR = "#0091ff"
@@ -28,12 +25,21 @@ YELLOW_COLOR = "#ffb800"
 GREEN_COLOR = "#1bc700"
 TIME_COLOR = "#3f8c96"
 COLORED_UNKNOWN_TEXT = "<span style='color:orange;'>Unknown</span>"
-COLORED_NONE_TEXT = "<span style='color:orange;'>None</span>"
-STATE_LOOKUP = {
-    "inactive": 0,
-    "searching": 1,
-    "locked": 2
+# the visible tags label is plain text colored by its style sheet, so updates skip the rich text parser
+NONE_TEXT = "None"
+NONE_STYLE = "color: orange;"
+VISIBLE_TAGS_STYLE = f"color: {GREEN_COLOR};"
+COLORED_TRUE_TEXT = f"<a style='color:{GREEN_COLOR};'>True</a>"
+COLORED_FALSE_TEXT = f"<a style='color:{YELLOW_COLOR};'>False</a>"
+COLORED_POSITION_ERROR_TEXT = f"<a style='color:{RED_COLOR};'>ERROR</a>"
+POSITION_TRACKING_LOOKUP = {
+    ZEDPositionStatus.OK: f"<a style='color:{GREEN_COLOR};'>GOOD</a>",
+    ZEDPositionStatus.SEARCHING: f"<a style='color:{YELLOW_COLOR};'>SEARCHING</a>",
+    ZEDPositionStatus.SEARCHING_FLOOR_PLANE: f"<a style='color:{YELLOW_COLOR};'>SEARCHING</a>",
+    None: COLORED_UNKNOWN_TEXT
 }
+# shortest time between label updates from high rate topics, only the newest text is shown
+LABEL_INTERVAL_MS = 33
 
 
 class HeadsUpDisplayWidget(BaseTabWidget):
@@ -43,10 +49,8 @@ class HeadsUpDisplayWidget(BaseTabWidget):
 
         self.setWindowTitle("HUD")
 
-        self.zed_pane: ZEDCameraPane | None = None
         self.thermal_pane: ThermalCameraPane | None = None
         self.water_pane: WaterDropPane | None = None
-        self.gimbal_pane: GimbalPane | None = None
         self.telemetry_pane: TelemetryPane | None = None
 
     def build(self) -> None:
@@ -59,8 +63,6 @@ class HeadsUpDisplayWidget(BaseTabWidget):
         camera_groupbox.setLayout(camera_layout)
         camera_groupbox.setFixedWidth(500)
 
-        # self.zed_pane = ZEDCameraPane(self)
-        # camera_layout.addWidget(self.zed_pane)
         self.thermal_pane = ThermalCameraPane(self)
         camera_layout.addWidget(self.thermal_pane)
 
@@ -74,17 +76,13 @@ class HeadsUpDisplayWidget(BaseTabWidget):
         self.water_pane = WaterDropPane(self, self.controller)
         control_layout.addWidget(self.water_pane)
 
-        # self.gimbal_pane = GimbalPane(self)
-        # control_layout.addWidget(self.gimbal_pane)
-
         self.telemetry_pane = TelemetryPane(self)
         control_layout.addWidget(self.telemetry_pane)
 
         layout.addWidget(control_groupbox, 0, 1)
 
     def process_message(self, topic: str, payload: str) -> None:
-        self.water_pane.process_message(topic, payload)
-        self.gimbal_pane.process_message(topic, payload)
+        pass
 
     def clear(self) -> None:
         pass
@@ -95,41 +93,8 @@ class HeadsUpDisplayWidget(BaseTabWidget):
         self.water_pane.setup_ros(client)
 
 
-class ZEDCameraPane(QtWidgets.QWidget):
-    toggle_connection = QtCore.Signal()
-    update_frame = QtCore.Signal(QtGui.QPixmap)
-
-    def __init__(self, parent: QtWidgets.QWidget) -> None:
-        super().__init__(parent)
-        self.setSizePolicy(QtWidgets.QSizePolicy.MinimumExpanding, QtWidgets.QSizePolicy.MinimumExpanding)
-
-        layout = QtWidgets.QVBoxLayout()
-        self.setLayout(layout)
-
-        zed_groupbox = QtWidgets.QGroupBox("ZED")
-        zed_groupbox.setSizePolicy(QtWidgets.QSizePolicy.MinimumExpanding, QtWidgets.QSizePolicy.MinimumExpanding)
-        # zed_groupbox.setMaximumWidth()
-        zed_layout = QtWidgets.QVBoxLayout()
-        zed_groupbox.setLayout(zed_layout)
-
-        self.view = GraphicsLabel((16, 9))
-        self.view.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.MinimumExpanding)
-        self.view.sizePolicy().setHeightForWidth(True)
-        self.view.setPixmap(QtGui.QPixmap("assets/blank720.png"))
-        self.view.setFixedWidth(200)
-        zed_layout.addWidget(self.view)
-
-        connection_button = QtWidgets.QPushButton("Toggle Connection")
-        connection_button.clicked.connect(self.toggle_connection)
-        zed_layout.addWidget(connection_button)
-
-        # layout.addWidget(zed_groupbox)
-
-        self.update_frame.connect(self.view.setPixmap)
-
-
 class ThermalCameraPane(QtWidgets.QWidget):
-    update_frame = QtCore.Signal(np.ndarray)
+    update_frame = QtCore.Signal(QtGui.QImage)
 
     def __init__(self, parent: QtWidgets.QWidget) -> None:
         super().__init__(parent)
@@ -138,37 +103,6 @@ class ThermalCameraPane(QtWidgets.QWidget):
         self.width_ = 300
         self.height_ = self.width_
 
-        # pixels within canvas
-        self.pixels_x = 32
-        self.pixels_y = self.pixels_x
-
-        self.pixel_width = self.width_ / self.pixels_x
-        self.pixel_height = self.height_ / self.pixels_y
-
-        # low range of the sensor (this will be blue on the screen)
-        self.MINTEMP = 20.0
-
-        # high range of the sensor (this will be red on the screen)
-        self.MAXTEMP = 32.0
-
-        # last lowest temp from camera
-        self.last_lowest_temp = 999.0
-
-        # how many color values we can have
-        self.COLORDEPTH = 1024
-
-        # how many pixels the camera is
-        self.camera_x = 8
-        self.camera_y = self.camera_x
-        self.camera_total = self.camera_x * self.camera_y
-
-        self.colors = [
-            (int(c.red * 255), int(c.green * 255), int(c.blue * 255))
-            for c in list(
-                colour.Color("indigo").range_to(colour.Color("red"), self.COLORDEPTH)
-            )
-        ]
-
         self.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
 
         layout = QtWidgets.QVBoxLayout()
@@ -180,44 +114,24 @@ class ThermalCameraPane(QtWidgets.QWidget):
         thermal_layout = QtWidgets.QVBoxLayout()
         thermal_groupbox.setLayout(thermal_layout)
 
-        # self.view = GraphicsLabel((1, 1))
-        # self.view.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        # self.view.sizePolicy().setHeightForWidth(True)
-        # self.view.setPixmap(QtGui.QPixmap("assets/blank_square.png"))
-        # self.view.setMinimumSize(200, 200)
-        self.canvas = QtWidgets.QGraphicsScene()
-        self.view = QtWidgets.QGraphicsView(self.canvas)
-        self.view.setGeometry(0, 0, 400, 400)
+        self.view = QtWidgets.QLabel()
+        self.view.setFixedSize(self.width_, self.height_)
+        # the frame pixmap stays at the camera resolution, the label scales it while painting
+        self.view.setScaledContents(True)
         thermal_layout.addWidget(self.view)
 
         layout.addWidget(thermal_groupbox)
 
         self.update_frame.connect(self.update_frame_callback)
 
-    def update_frame_callback(self, frame: np.ndarray) -> None:
-        pen = QtGui.QPen(QtCore.Qt.PenStyle.NoPen)
-        self.canvas.clear()
-
-        for ix, row in enumerate(frame):
-            for jx, pixel in enumerate(row):
-                brush = QtGui.QBrush(
-                    QtGui.QColor(
-                        *self.colors[int(constrain(pixel, 0, self.COLORDEPTH - 1))]
-                    )
-                )
-                self.canvas.addRect(
-                    self.pixel_width * jx,
-                    self.pixel_height * ix,
-                    self.pixel_width,
-                    self.pixel_height,
-                    pen,
-                    brush,
-                )
+    def update_frame_callback(self, frame: QtGui.QImage) -> None:
+        self.view.setPixmap(QtGui.QPixmap.fromImage(frame))
 
 
 class WaterDropPane(QtWidgets.QWidget):
     move_dropper = QtCore.Signal(int)
     auto_done = QtCore.Signal()
+    tags_text_signal = QtCore.Signal(str)
 
     def __init__(self, parent: QtWidgets.QWidget, controller: Dualsense) -> None:
         super().__init__(parent)
@@ -240,11 +154,11 @@ class WaterDropPane(QtWidgets.QWidget):
         water_drop_groupbox.setLayout(water_drop_layout)
         water_drop_groupbox.setMinimumWidth(100)
 
-        self.trigger_button = QtWidgets.QPushButton("Trigger")
+        self.trigger_button = DebounceButton("Trigger")
         self.trigger_button.clicked.connect(self.trigger_bdu)
         water_drop_layout.addWidget(self.trigger_button)
 
-        self.full_trigger_button = QtWidgets.QPushButton("Full Trigger")
+        self.full_trigger_button = DebounceButton("Full Trigger")
         self.full_trigger_button.clicked.connect(self.trigger_bdu_full)
         water_drop_layout.addWidget(self.full_trigger_button)
 
@@ -253,16 +167,13 @@ class WaterDropPane(QtWidgets.QWidget):
         self.atag_radio_button = QtWidgets.QRadioButton()
         self.auton_radio_group.addButton(self.atag_radio_button, 1)
         self.atag_radio_button.setText('Blink')
-        self.atag_radio_button.pressed.connect(
-            lambda: self.set_auton_drop_mode(1)
-        )
 
         self.atag_drop_radio_button = QtWidgets.QRadioButton()
         self.auton_radio_group.addButton(self.atag_drop_radio_button, 2)
         self.atag_drop_radio_button.setText('Drop')
-        self.atag_drop_radio_button.pressed.connect(
-            lambda: self.set_auton_drop_mode(2)
-        )
+
+        # the button ids are the auton drop modes
+        self.auton_radio_group.idPressed.connect(self.set_auton_drop_mode)
 
         self.atag_cancel_button = QtWidgets.QPushButton('X')
         self.atag_cancel_button.setEnabled(False)
@@ -278,9 +189,9 @@ class WaterDropPane(QtWidgets.QWidget):
 
         water_drop_layout.addRow('Autonomy: ', radio_button_widget)
 
-        self.tags_label = QtWidgets.QLabel(
-            f"{COLORED_NONE_TEXT}"
-        )
+        self.tags_label = QtWidgets.QLabel(NONE_TEXT)
+        self.tags_label.setTextFormat(QtCore.Qt.TextFormat.PlainText)
+        self.tags_label.setStyleSheet(NONE_STYLE)
         water_drop_layout.addRow("Visible Tags:", self.tags_label)
 
         self.full_drops_label = QtWidgets.QLabel(
@@ -308,10 +219,19 @@ class WaterDropPane(QtWidgets.QWidget):
         self.auton_use_full_drop_client: roslibpy.Service | None = None
         self.auton_drop_client: Action | None = None
 
+        # trigger requests carry no data, so one instance is shared by every call
+        self.empty_request = roslibpy.ServiceRequest()
+
         self.current_mode = 0
 
         self.use_full_drops = False
 
+        # last text shown in tags_label, detections repeat a lot so unchanged text isn't set again
+        self.tags_text = NONE_TEXT
+        self.pending_tags_text = NONE_TEXT
+        self.tags_timer = CoalesceTimer(LABEL_INTERVAL_MS, self.show_pending_tags_text, self)
+        self.tags_text_signal.connect(self.queue_tags_text, QtCore.Qt.ConnectionType.QueuedConnection)
+
         if not os.path.isdir('log'):
             os.mkdir('log')
 
@@ -328,29 +248,32 @@ class WaterDropPane(QtWidgets.QWidget):
         self.full_drops_label.setText(self.format_use_full_drops(self.use_full_drops))
         self.auton_use_full_drop_client.call(
             roslibpy.ServiceRequest({'data': self.use_full_drops}),
-            callback=lambda msg: print(f'Use full drops response: {msg}')
+            callback=lambda msg: logger.debug('Use full drops response: {}', msg)
         )
 
     def start_log_file(self) -> None:
         self.open_log_button.setEnabled(False)
         self.close_log_button.setEnabled(True)
         if self.log_file is None:
-            self.log_file = open(f'log/{datetime.datetime.utcnow().isoformat()}.log', 'w')
-            self.log_start_time = time.time() + 5
-            self.log_to_file(f'Started log at {round(self.log_start_time)}')
+            # line buffered, so each entry reaches the file without flushing on every write
+            self.log_file = open(f'log/{datetime.datetime.utcnow().isoformat()}.log', 'w', buffering=1)
+            # entries are timed against the monotonic clock so wall clock adjustments can't skew them
+            self.log_start_time = time.monotonic() + 5
+            self.log_to_file(f'Started log at {round(time.time() + 5)}')
             self.controller.mic_button.led_state = True
             Thread(target=self.show_log_countdown, daemon=True).start()
 
     def log_to_file(self, text: str) -> None:
         if self.log_file is not None:
-            self.log_file.write(f'{round(time.time() - self.log_start_time)}: {text}\n')
-            self.log_file.flush()
+            self.log_file.write(f'{round(time.monotonic() - self.log_start_time)}: {text}\n')
 
     def close_log_file(self) -> None:
         self.open_log_button.setEnabled(True)
         self.close_log_button.setEnabled(False)
         if self.log_file is not None:
-            self.log_to_file(f'Closed file at {round(time.time())} (Ran for {round(time.time() - self.log_start_time)}s)')
+            self.log_to_file(f'Closed file at {round(time.time())} (Ran for {round(time.monotonic() - self.log_start_time)}s)')
+            self.log_file.flush()
+            os.fsync(self.log_file.fileno())
             self.log_file.close()
             Toast.get().show_message(f'Saved log to: {self.log_file.name}', 4)
             self.log_file = None
@@ -359,7 +282,20 @@ class WaterDropPane(QtWidgets.QWidget):
     def detections_callback(self, msg: dict[str, Any]) -> None:
         detections = msg.get('detections', [])
         tags = [detection.get('id', '?') for detection in detections]
-        self.tags_label.setText(self.format_visible_tags(tags))
+        tags_text = self.format_visible_tags(tags)
+        if tags_text != self.tags_text:
+            self.tags_text = tags_text
+            self.tags_text_signal.emit(tags_text)
+
+    def queue_tags_text(self, text: str) -> None:
+        self.pending_tags_text = text
+        self.tags_timer.queue()
+
+    def show_pending_tags_text(self) -> None:
+        style = NONE_STYLE if self.pending_tags_text == NONE_TEXT else VISIBLE_TAGS_STYLE
+        if style != self.tags_label.styleSheet():
+            self.tags_label.setStyleSheet(style)
+        self.tags_label.setText(self.pending_tags_text)
 
     def enable_drop(self) -> None:
         self.atag_drop_radio_button.setChecked(True)
@@ -379,7 +315,6 @@ class WaterDropPane(QtWidgets.QWidget):
                     if self.current_mode != 0:
                         self.auton_drop_client.cancel()
                     self.controller.touchpad.led_color = (255, 150, 0) if mode == 2 else (0, 255, 0)
-                    print(self.controller.touchpad.led_color)
                     self.auton_drop_client.send_goal({'should_drop': mode == 2})
                 else:
                     self.auton_drop_client.cancel()
@@ -388,14 +323,11 @@ class WaterDropPane(QtWidgets.QWidget):
 
     def auton_feedback_callback(self, msg: dict[str, Any]) -> None:
         apriltag_id = msg.get('_apriltag_id', None)
+        action = 'Blinking' if self.current_mode == 1 else 'Dropping'
 
-        if self.current_mode == 1:
-            msg = f'Blinking for tag: {apriltag_id}'
-        else:
-            msg = f'Dropping for tag: {apriltag_id}'
-
-        logger.info(msg)
-        self.log_to_file(msg)
+        logger.info('{} for tag: {}', action, apriltag_id)
+        if self.log_file is not None:
+            self.log_to_file(f'{action} for tag: {apriltag_id}')
 
     def auton_drop_finished(self, _: dict[str, Any]) -> None:
         self.log_to_file(f'Finished auton drop')
@@ -410,38 +342,35 @@ class WaterDropPane(QtWidgets.QWidget):
         self.controller.touchpad.led_color = (255, 0, 0)
 
     def trigger_bdu_full(self) -> None:
-        if self.bdu_full_trigger is not None:
+        if self.bdu_full_trigger is not None and self.full_trigger_button.debounce():
             self.stop_auton_drop()
-            self.bdu_full_trigger.call(
-                roslibpy.ServiceRequest(),
-                callback=lambda msg: logger.debug(
-                    'Bdu trigger result: ' + msg.get('message', '')
-                )
-            )
+            self.bdu_full_trigger.call(self.empty_request, callback=self.bdu_full_trigger_callback)
             self.log_to_file(f'Full manual drop triggered')
 
     def trigger_bdu(self) -> None:
-        if self.bdu_trigger is not None:
+        if self.bdu_trigger is not None and self.trigger_button.debounce():
             self.stop_auton_drop()
-            self.bdu_trigger.call(
-                roslibpy.ServiceRequest(),
-                callback=lambda msg: logger.debug(
-                    'Bdu trigger m result: ' + msg.get('message', '')
-                )
-            )
+            self.bdu_trigger.call(self.empty_request, callback=self.bdu_trigger_callback)
             self.log_to_file(f'Stage manual drop triggered')
 
     def reset_bdu(self) -> None:
         if self.bdu_reset is not None:
             self.stop_auton_drop()
-            self.bdu_reset.call(
-                roslibpy.ServiceRequest(),
-                callback=lambda msg: logger.debug(
-                    'Bdu reset m result: ' + msg.get('message', '')
-                )
-            )
+            self.bdu_reset.call(self.empty_request, callback=self.bdu_reset_callback)
             self.log_to_file(f'Reset BDU')
 
+    @staticmethod
+    def bdu_full_trigger_callback(msg: dict[str, Any]) -> None:
+        logger.debug('Bdu trigger result: ' + msg.get('message', ''))
+
+    @staticmethod
+    def bdu_trigger_callback(msg: dict[str, Any]) -> None:
+        logger.debug('Bdu trigger m result: ' + msg.get('message', ''))
+
+    @staticmethod
+    def bdu_reset_callback(msg: dict[str, Any]) -> None:
+        logger.debug('Bdu reset m result: ' + msg.get('message', ''))
+
     def setup_ros(self, client: roslibpy.Ros) -> None:
         self.detections_subscriber = roslibpy.Topic(
             client,
@@ -488,53 +417,15 @@ class WaterDropPane(QtWidgets.QWidget):
     @staticmethod
     def format_use_full_drops(use_full_drops: bool) -> str:
         if use_full_drops:
-            return f"<a style='color:{GREEN_COLOR};'>True</a>"
+            return COLORED_TRUE_TEXT
         else:
-            return f"<a style='color:{YELLOW_COLOR};'>False</a>"
+            return COLORED_FALSE_TEXT
 
     @staticmethod
     def format_visible_tags(tags: list[int]) -> str:
         if len(tags) < 1:
-            return COLORED_NONE_TEXT
-        text = ''
-        for tag_id in tags:
-            text += f"{tag_id},"
-        text = text[:-1]
-        return f"<a style='color:{GREEN_COLOR};'>{text}</a>"
-
-
-class GimbalPane(QtWidgets.QWidget):
-    def __init__(self, parent: QtWidgets.QWidget) -> None:
-        super().__init__(parent)
-        self.setSizePolicy(QtWidgets.QSizePolicy.MinimumExpanding, QtWidgets.QSizePolicy.MinimumExpanding)
-
-        layout = QtWidgets.QVBoxLayout()
-        self.setLayout(layout)
-
-        gimbal_groupbox = QtWidgets.QGroupBox("Gimbal")
-        gimbal_groupbox.setSizePolicy(QtWidgets.QSizePolicy.MinimumExpanding, QtWidgets.QSizePolicy.MinimumExpanding)
-        gimbal_layout = QtWidgets.QGridLayout()
-        gimbal_groupbox.setLayout(gimbal_layout)
-        gimbal_groupbox.setMinimumWidth(100)
-
-        self.yaw_dial = QtWidgets.QDial()
-        self.yaw_dial.setWrapping(True)
-        self.yaw_dial.setRange(-100, 100)
-        self.yaw_dial.setValue(0)
-        self.yaw_dial.setMaximumWidth(200)
-        self.yaw_dial.setStyleSheet("border: 4px solid white ; border-radius: 82px;")
-        self.yaw_dial.setDisabled(True)
-        gimbal_layout.addWidget(self.yaw_dial, 0, 0, 0, 1)
-
-        self.pitch_bar = QtWidgets.QProgressBar()
-        self.pitch_bar.setOrientation(QtCore.Qt.Orientation.Vertical)
-        self.pitch_bar.setRange(-50, 50)
-        self.pitch_bar.setValue(0)
-        self.pitch_bar.setMinimumWidth(10)
-        self.pitch_bar.setContentsMargins(0, 0, 50, 0)
-        gimbal_layout.addWidget(self.pitch_bar, 0, 2, 0, 1)
-
-        layout.addWidget(gimbal_groupbox)
+            return NONE_TEXT
+        return ','.join(map(str, tags))
 
 
 class TelemetryPane(QtWidgets.QWidget):
@@ -562,12 +453,7 @@ class TelemetryPane(QtWidgets.QWidget):
         self.battery_current_label = QtWidgets.QLabel("")
         battery_layout.addWidget(self.battery_voltage_label)
         battery_layout.addWidget(self.battery_current_label)
-        self.formatted_battery_signal.connect(
-            lambda voltage, _: self.battery_voltage_label.setText(voltage)
-        )
-        self.formatted_battery_signal.connect(
-            lambda _, current: self.battery_current_label.setText(current)
-        )
+        self.formatted_battery_signal.connect(self.set_battery_text, QtCore.Qt.ConnectionType.QueuedConnection)
 
         telemetry_layout.addWidget(QtWidgets.QLabel("Battery:"), 0, 0)
         telemetry_layout.addLayout(battery_layout, 0, 1)
@@ -576,34 +462,31 @@ class TelemetryPane(QtWidgets.QWidget):
         self.armed_label = QtWidgets.QLabel(COLORED_UNKNOWN_TEXT)
         telemetry_layout.addWidget(QtWidgets.QLabel("Armed Status:"), 1, 0)
         telemetry_layout.addWidget(self.armed_label, 1, 1)
-        self.formatted_armed_signal.connect(self.armed_label.setText)
+        self.formatted_armed_signal.connect(self.armed_label.setText, QtCore.Qt.ConnectionType.QueuedConnection)
 
         # flight mode row
         self.mode_label = QtWidgets.QLabel(COLORED_UNKNOWN_TEXT)
         telemetry_layout.addWidget(QtWidgets.QLabel("Flight Mode:"), 2, 0)
         telemetry_layout.addWidget(self.mode_label, 2, 1)
-        self.formatted_mode_signal.connect(self.mode_label.setText)
+        self.formatted_mode_signal.connect(self.mode_label.setText, QtCore.Qt.ConnectionType.QueuedConnection)
 
         # position tracking row
         self.pose_state_label = QtWidgets.QLabel(COLORED_UNKNOWN_TEXT)
         telemetry_layout.addWidget(QtWidgets.QLabel("Position Tracking:"), 3, 0)
         telemetry_layout.addWidget(self.pose_state_label, 3, 1)
-        self.pose_state_signal.connect(
-            lambda state: self.pose_state_label.setText(self.format_position_tracking(state))
-        )
+        self.pose_state_signal.connect(self.set_pose_state, QtCore.Qt.ConnectionType.QueuedConnection)
 
         layout.addWidget(telemetry_groupbox)
 
+    @QtCore.Slot(str, str)
+    def set_battery_text(self, voltage: str, current: str) -> None:
+        self.battery_voltage_label.setText(voltage)
+        self.battery_current_label.setText(current)
+
+    @QtCore.Slot(object)
+    def set_pose_state(self, state: ZEDPositionStatus | None) -> None:
+        self.pose_state_label.setText(self.format_position_tracking(state))
+
     @staticmethod
     def format_position_tracking(status: ZEDPositionStatus | None) -> str:
-        match status:
-            case ZEDPositionStatus.OK:
-                return f"<a style='color:{GREEN_COLOR};'>GOOD</a>"
-            case ZEDPositionStatus.SEARCHING:
-                return f"<a style='color:{YELLOW_COLOR};'>SEARCHING</a>"
-            case ZEDPositionStatus.SEARCHING_FLOOR_PLANE:
-                return f"<a style='color:{YELLOW_COLOR};'>SEARCHING</a>"
-            case None:
-                return COLORED_UNKNOWN_TEXT
-            case _:
-                return f"<a style='color:{RED_COLOR};'>ERROR</a>"
+        return POSITION_TRACKING_LOOKUP.get(status, COLORED_POSITION_ERROR_TEXT)
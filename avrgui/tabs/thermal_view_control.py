@@ -1,35 +1,36 @@
+import base64
 import json
 import math
-import time
 from enum import Enum, auto
-from typing import Any, List
+from threading import Lock
+from typing import Any
 
-import colour
+import cv2
 import numpy as np
 import roslibpy
-import scipy
 from PySide6 import QtCore, QtGui, QtWidgets
 from loguru import logger
 
 from .base import BaseTabWidget
 from .connection.rosbridge import RosBridgeClient
-from ..lib import stream
-from ..lib.graphics_label import GraphicsLabel
-from ..lib.utils import constrain
-
-
-def map_value(
-        x: float, in_min: float, in_max: float, out_min: float, out_max: float
-) -> float:
-    return (x - in_min) * (out_max - out_min) / (in_max - in_min) + out_min
-
-
-def deadzone(value: float | int, min_value: float | int) -> float | int:
-    number_type = type(value)
-    if min_value <= value <= -min_value:
-        return number_type(0)
-    else:
-        return value
+from ..lib.calc import deadzone
+from ..lib.color import thermal_palette
+from ..lib.timers import CoalesceTimer
+from ..lib.widgets import DebounceButton
+
+# shortest time between thermal repaints, bursts of frames in between are coalesced to the newest one
+FRAME_INTERVAL_MS = 33
+# shortest time between gimbal updates, joystick moves in between only update the pending position
+SERVO_INTERVAL_MS = 100
+
+# fixed joystick ranges, premultiplied so the hot paths map a value with a single multiply
+# controller stick (-130 to 130) to joystick travel (0 to 200)
+CONTROLLER_SCALE = 200 / 260
+# joystick travel (0 to 200) to servo degrees (0 to 180)
+SERVO_SCALE = 180 / 200
+# centered joystick travel (-100 to 100) to relative gimbal steps
+MOVE_X_SCALE = 20 / 100
+MOVE_Y_SCALE = 10 / 100
 
 
 class Direction(Enum):
@@ -39,8 +40,13 @@ class Direction(Enum):
     Down = auto()
 
 
+# joystick direction for each 90 degree slice of the angle, starting at the slice centered on 0 (right)
+DIRECTION_TABLE = (Direction.Right, Direction.Up, Direction.Left, Direction.Down)
+
+
 class ThermalView(QtWidgets.QWidget):
-    update_frame = QtCore.Signal(object)
+    new_frame = QtCore.Signal()
+    update_frame = QtCore.Signal(QtGui.QImage)
 
     def __init__(self, parent: QtWidgets.QWidget) -> None:
         super().__init__(parent)
@@ -65,32 +71,23 @@ class ThermalView(QtWidgets.QWidget):
         # last lowest temp from camera
         self.last_lowest_temp = 999.0
 
+        # last frame that was drawn, mapped to color indices
+        self.last_float_pixels: np.ndarray | None = None
+
         # how many color values we can have
         self.COLORDEPTH = 1024
 
+        # color indices per degree, so mapping a frame is a subtract and a multiply
+        self.index_scale = 0.0
+        self.update_index_scale()
+
         # how many pixels the camera is
         self.camera_x = 8
         self.camera_y = self.camera_x
         self.camera_total = self.camera_x * self.camera_y
 
-        # create list of x/y points
-        self.points = [
-            (math.floor(ix / self.camera_x), (ix % self.camera_y))
-            for ix in range(self.camera_total)
-        ]
-        # I'm not fully sure what this does
-        self.grid_x, self.grid_y = np.mgrid[
-                                   0: self.camera_x - 1: self.camera_total / 2j,
-                                   0: self.camera_y - 1: self.camera_total / 2j,
-                                   ]
-
         # create available colors
-        self.colors = [
-            (int(c.red * 255), int(c.green * 255), int(c.blue * 255))
-            for c in list(
-                colour.Color("indigo").range_to(colour.Color("red"), self.COLORDEPTH)
-            )
-        ]
+        self.colors = thermal_palette(self.COLORDEPTH)
 
         # create canvas
         layout = QtWidgets.QVBoxLayout()
@@ -99,72 +96,91 @@ class ThermalView(QtWidgets.QWidget):
         self.canvas = QtWidgets.QGraphicsScene()
         self.view = QtWidgets.QGraphicsView(self.canvas)
         self.view.setGeometry(0, 0, self.width_, self.height_)
-        # self.view = GraphicsLabel((1, 1))
-        # self.view.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.MinimumExpanding)
-        # self.view.sizePolicy().setHeightForWidth(True)
-        # self.view.setPixmap(QtGui.QPixmap("assets/blank_square.png"))
+        self.canvas.setSceneRect(0, 0, self.width_, self.height_)
 
         layout.addWidget(self.view)
 
+        # each frame is drawn as one pixmap at the camera resolution, the item scales it up to the canvas
+        self.frame_item = self.canvas.addPixmap(QtGui.QPixmap())
+        self.frame_item.setTransform(QtGui.QTransform.fromScale(self.pixel_width, self.pixel_height))
+        # smooth like the heads up pane's label, so the two thermal views look the same
+        self.frame_item.setTransformationMode(QtCore.Qt.TransformationMode.SmoothTransformation)
+
+        # frame buffers, reused every frame so the conversion on the ros thread doesn't allocate new arrays
+        self.upscaled = np.empty((self.pixels_y, self.pixels_x), dtype=np.float32)
+        self.indices = np.empty((self.pixels_y, self.pixels_x), dtype=np.intp)
+        self.rgb = np.empty((self.pixels_y, self.pixels_x, 3), dtype=np.uint8)
+
         # need a bit of padding for the edges of the canvas
         self.setFixedSize(self.width_ + 50, self.height_ + 50)
 
+        # latest rendered frame, replaced by the ros thread until the gui thread takes it
+        self.pending_frame: QtGui.QImage | None = None
+        self.pending_frame_lock = Lock()
+        self.frame_timer = CoalesceTimer(FRAME_INTERVAL_MS, self.emit_pending_frame, self)
+
+        self.new_frame.connect(self.frame_timer.queue, QtCore.Qt.ConnectionType.QueuedConnection)
         self.update_frame.connect(self.update_canvas_2)
 
     def set_temp_range(self, mintemp: float, maxtemp: float) -> None:
         self.MINTEMP = mintemp
         self.MAXTEMP = maxtemp
+        self.update_index_scale()
 
     def set_calibrated_temp_range(self) -> None:
         self.MINTEMP = self.last_lowest_temp + 0.0
         self.MAXTEMP = self.last_lowest_temp + 15.0
+        self.update_index_scale()
 
-    def check_size(self, height, width) -> None:
-        if not height == self.pixels_y or not width == self.pixels_x:
-            self.pixels_y = height
-            self.pixels_x = width
-
-            self.pixel_width = self.width_ / self.pixels_x
-            self.pixel_height = self.height_ / self.pixels_y
+    def update_index_scale(self) -> None:
+        self.index_scale = (self.COLORDEPTH - 1) / max(self.MAXTEMP - self.MINTEMP, 1e-6)
 
-    def update_canvas(self, pixels: List[float]) -> None:
-        float_pixels = [
-            map_value(p, self.MINTEMP, self.MAXTEMP, 0, self.COLORDEPTH - 1)
-            for p in pixels
-        ]
+    def update_canvas(self, pixels: np.ndarray) -> None:
+        float_pixels = (pixels - self.MINTEMP) * self.index_scale
+        # the camera often repeats a frame, skip the interpolation and both repaints when nothing changed
+        if self.last_float_pixels is not None and np.array_equal(float_pixels, self.last_float_pixels):
+            return
+        self.last_float_pixels = float_pixels
 
         float_pixels_matrix = np.reshape(float_pixels, (self.camera_x, self.camera_y))
         rotated_float_pixels = np.rot90(np.rot90(float_pixels_matrix))
-        rotated_float_pixels = rotated_float_pixels.flatten()
 
-        bicubic = scipy.interpolate.griddata(
-            self.points,
-            rotated_float_pixels,
-            (self.grid_x, self.grid_y),
-            method="cubic",
-        )
+        image = self.render_frame(rotated_float_pixels, (self.pixels_x, self.pixels_y))
+        with self.pending_frame_lock:
+            already_pending = self.pending_frame is not None
+            self.pending_frame = image
+        # only wake the gui thread once per pending frame, later frames just replace it
+        if not already_pending:
+            self.new_frame.emit()
 
-        self.update_frame.emit(bicubic)
+    def render_frame(self, frame: np.ndarray, size: tuple[int, int]) -> QtGui.QImage:
+        width, height = size
+        if self.indices.shape != (height, width):
+            self.upscaled = np.empty((height, width), dtype=np.float32)
+            self.indices = np.empty((height, width), dtype=np.intp)
+            self.rgb = np.empty((height, width, 3), dtype=np.uint8)
 
-    def update_canvas_2(self, frame: np.ndarray):
-        pen = QtGui.QPen(QtCore.Qt.PenStyle.NoPen)
-        self.canvas.clear()
+        # upscale the camera grid to the frame size, bilinear is plenty for a live 8x8 view
+        # (opencv only writes into the buffer when the dtype matches, otherwise it returns a new array)
+        upscaled = cv2.resize(frame, size, dst=self.upscaled, interpolation=cv2.INTER_LINEAR)
 
-        for ix, row in enumerate(frame):
-            for jx, pixel in enumerate(row):
-                brush = QtGui.QBrush(
-                    QtGui.QColor(
-                        *self.colors[int(constrain(pixel, 0, self.COLORDEPTH - 1))]
-                    )
-                )
-                self.canvas.addRect(
-                    self.pixel_width * jx,
-                    self.pixel_height * ix,
-                    self.pixel_width,
-                    self.pixel_height,
-                    pen,
-                    brush,
-                )
+        # truncate straight to indices, out of range ones are clipped by the gather
+        np.copyto(self.indices, upscaled, casting="unsafe")
+        np.take(self.colors, self.indices, axis=0, out=self.rgb, mode="clip")
+        rgb = self.rgb
+
+        # the buffer is reused for the next frame, so the image needs its own copy of the pixels
+        return QtGui.QImage(rgb.data, width, height, rgb.strides[0], QtGui.QImage.Format.Format_RGB888).copy()
+
+    def emit_pending_frame(self) -> None:
+        with self.pending_frame_lock:
+            frame = self.pending_frame
+            self.pending_frame = None
+        if frame is not None:
+            self.update_frame.emit(frame)
+
+    def update_canvas_2(self, frame: QtGui.QImage):
+        self.frame_item.setPixmap(QtGui.QPixmap.fromImage(frame))
 
 
 class JoystickWidget(BaseTabWidget):
@@ -173,6 +189,8 @@ class JoystickWidget(BaseTabWidget):
 
         self.controller_checkbox = controller_checkbox
         self.setFixedSize(300, 300)
+        # the center only moves on resize, so it is kept instead of rebuilt for every event
+        self.center = QtCore.QPointF(self.width() / 2, self.height() / 2)
 
         self.movingOffset = QtCore.QPointF(0, 0)
 
@@ -181,7 +199,19 @@ class JoystickWidget(BaseTabWidget):
         self.relative_movement = False
         self.__maxDistance = 100
 
-        self.last_time = 0
+        # shapes used on every paint, built once and translated into place
+        self.bounds_rect = QtCore.QRectF(
+            -self.__maxDistance,
+            -self.__maxDistance,
+            self.__maxDistance * 2,
+            self.__maxDistance * 2
+        )
+        self.handle_rect = QtCore.QRectF(-20, -20, 40, 40)
+        self.handle_brush = QtGui.QBrush(QtCore.Qt.GlobalColor.black)
+
+        self.servo_timer = CoalesceTimer(SERVO_INTERVAL_MS, self.update_servos, self)
+        # last position handed to the gimbal, so a held joystick doesn't resend it
+        self.last_gimbal_pos: tuple[int, int] | None = None
 
         self.current_y = 0
         self.current_x = 0
@@ -199,6 +229,10 @@ class JoystickWidget(BaseTabWidget):
         pass
 
     def move_gimbal(self, x_servo: int, y_servo: int) -> None:
+        if (x_servo, y_servo) == self.last_gimbal_pos:
+            return
+        self.last_gimbal_pos = (x_servo, y_servo)
+
         # self.send_message(
         #         "avr/pcm/set_servo_pct",
         #         AvrPcmSetServoPctPayload(servo = 2, percent = x_servo_percent),
@@ -225,68 +259,53 @@ class JoystickWidget(BaseTabWidget):
 
     def update_servos(self) -> None:
         """
-        Update the servos on joystick movement.
+        Update the servos from the latest joystick position.
         """
-        ss = time.time()
-        timesince = ss - self.last_time
-        if timesince >= 0.3 or 98 < self.current_x < 102 or 98 < self.current_y < 102:
-            if not self.relative_movement:
-                # y_reversed = 100 - self.current_y
-                y_reversed = self.current_y
-
-                x_servo_pos = round(map_value(self.current_x, 0, 200, 0, 180))
-                y_servo_pos = round(map_value(y_reversed, 0, 200, 0, 180))
-
-                if not 0 <= x_servo_pos <= 180:
-                    return
-                if not 0 <= y_servo_pos <= 180:
-                    return
-
-                self.move_gimbal(x_servo_pos, y_servo_pos)
-            else:
-                # ms = int(round(time.time() * 1000))
-                # timesince = ms - self.last_time
-                # if timesince > 100:
-                #     return
-                # self.last_time = ms
-
-                x = deadzone(map_value(self.current_x, 0, 200, -100, 100), 10)
-                y = deadzone(map_value(self.current_y, 0, 200, -100, 100), 10)
-
-                x = int(map_value(x, -100, 100, -20, 20))
-                y = int(map_value(y, -100, 100, -10, 10))
-                # self.send_message("avr/gimbal/move", json.dumps({"x": x, "y": y}))
-                # self.zmq_client.zmq_publish(
-                #         "gimbal_move",
-                #         {
-                #             "x": x,
-                #             "y": y
-                #         }
-                # )
-            self.last_time = ss
+        if not self.relative_movement:
+            # y_reversed = 100 - self.current_y
+            y_reversed = self.current_y
+
+            x_servo_pos = round(self.current_x * SERVO_SCALE)
+            y_servo_pos = round(y_reversed * SERVO_SCALE)
+
+            if not 0 <= x_servo_pos <= 180:
+                return
+            if not 0 <= y_servo_pos <= 180:
+                return
+
+            self.move_gimbal(x_servo_pos, y_servo_pos)
+        else:
+            x = deadzone(self.current_x - 100, 10)
+            y = deadzone(self.current_y - 100, 10)
+
+            x = int(x * MOVE_X_SCALE)
+            y = int(y * MOVE_Y_SCALE)
+            # self.send_message("avr/gimbal/move", json.dumps({"x": x, "y": y}))
+            # self.zmq_client.zmq_publish(
+            #         "gimbal_move",
+            #         {
+            #             "x": x,
+            #             "y": y
+            #         }
+            # )
 
     def paintEvent(self, event) -> None:
         painter = QtGui.QPainter(self)
-        bounds = QtCore.QRectF(
-            -self.__maxDistance,
-            -self.__maxDistance,
-            self.__maxDistance * 2,
-            self.__maxDistance * 2
-        ).translated(self._center())
-        painter.drawEllipse(bounds)
-        painter.setBrush(QtCore.Qt.GlobalColor.black)
+        painter.drawEllipse(self.bounds_rect.translated(self.center))
+        painter.setBrush(self.handle_brush)
         painter.drawEllipse(self._center_ellipse())
 
     def _center_ellipse(self) -> QtCore.QRectF:
         if self.grabCenter or self.controller_enabled:
-            return QtCore.QRectF(-20, -20, 40, 40).translated(self.movingOffset)
-        return QtCore.QRectF(-20, -20, 40, 40).translated(self._center())
+            return self.handle_rect.translated(self.movingOffset)
+        return self.handle_rect.translated(self.center)
 
-    def _center(self) -> QtCore.QPointF:
-        return QtCore.QPointF(self.width() / 2, self.height() / 2)
+    def resizeEvent(self, event) -> None:
+        self.center = QtCore.QPointF(self.width() / 2, self.height() / 2)
+        super().resizeEvent(event)
 
     def _bound_joystick(self, point) -> QtCore.QPointF:
-        limit_line = QtCore.QLineF(self._center(), point)
+        limit_line = QtCore.QLineF(self.center, point)
         if limit_line.length() > self.__maxDistance:
             limit_line.setLength(self.__maxDistance)
         return limit_line.p2()
@@ -294,18 +313,13 @@ class JoystickWidget(BaseTabWidget):
     def joystick_direction(self) -> tuple[Direction, float] | int:
         if not self.grabCenter and not self.controller_enabled:
             return 0
-        norm_vector = QtCore.QLineF(self._center(), self.movingOffset)
-        current_distance = norm_vector.length()
-        angle = norm_vector.angle()
-
-        distance = min(current_distance / self.__maxDistance, 1.0)
-        if 45 <= angle < 135:
-            return Direction.Up, distance
-        elif 135 <= angle < 225:
-            return Direction.Left, distance
-        elif 225 <= angle < 315:
-            return Direction.Down, distance
-        return Direction.Right, distance
+        # screen y grows downwards, flip it so the angle goes counterclockwise like QLineF.angle
+        dx = self.movingOffset.x() - self.center.x()
+        dy = self.center.y() - self.movingOffset.y()
+        angle = math.degrees(math.atan2(dy, dx)) % 360
+
+        distance = min(math.hypot(dx, dy) / self.__maxDistance, 1.0)
+        return DIRECTION_TABLE[int((angle + 45) // 90) % 4], distance
 
     def mousePressEvent(self, ev) -> Any:
         self.grabCenter = self._center_ellipse().contains(ev.pos())
@@ -318,20 +332,25 @@ class JoystickWidget(BaseTabWidget):
         self.grabCenter = False
         self.movingOffset = QtCore.QPointF(0, 0)
         self.update()
+        # drop the pending update so it doesn't move the gimbal back after letting go
+        self.servo_timer.stop()
         if not self.relative_movement:
             self.center_gimbal()
 
     def mouseMoveEvent(self, event) -> Any:
-        if self.grabCenter or self.controller_enabled:
-            self.movingOffset = self._bound_joystick(event.pos())
-            self.update()
+        # hovering without holding the joystick doesn't move it, so there is nothing to draw or send
+        if not (self.grabCenter or self.controller_enabled):
+            return super().mouseMoveEvent(event)
 
-        self.current_x = self.movingOffset.x() - self._center().x() + self.__maxDistance
-        self.current_y = self.movingOffset.y() - self._center().y() + self.__maxDistance
-        self.update_servos()
+        self.movingOffset = self._bound_joystick(event.pos())
+        self.update()
+
+        self.current_x = self.movingOffset.x() - self.center.x() + self.__maxDistance
+        self.current_y = self.movingOffset.y() - self.center.y() + self.__maxDistance
+        self.servo_timer.queue()
 
     def center_gimbal(self) -> None:
-        pass
+        self.last_gimbal_pos = None
         # self.send_message("avr/gimbal/center", "{}")
 
     def set_pos(self, x: float, y: float) -> None:
@@ -339,18 +358,18 @@ class JoystickWidget(BaseTabWidget):
             self.movingOffset = self._bound_joystick(
                 QtCore.QPoint(
                     int(
-                        x + self._center().x() - self.__maxDistance
+                        x + self.center.x() - self.__maxDistance
                     ),
                     int(
-                        y + self._center().y() - self.__maxDistance
+                        y + self.center.y() - self.__maxDistance
                     )
                 )
             )
             self.update()
 
-            self.current_x = self.movingOffset.x() - self._center().x() + self.__maxDistance
-            self.current_y = self.movingOffset.y() - self._center().y() + self.__maxDistance
-            self.update_servos()
+            self.current_x = self.movingOffset.x() - self.center.x() + self.__maxDistance
+            self.current_y = self.movingOffset.y() - self.center.y() + self.__maxDistance
+            self.servo_timer.queue()
 
 
 class ThermalViewControlWidget(BaseTabWidget):
@@ -359,11 +378,11 @@ class ThermalViewControlWidget(BaseTabWidget):
 
         self.relative_checkbox = None
         self.auto_checkbox = None
-        self.last_fire = 0
         self.joystick = None
         self.viewer: ThermalView | None = None
         self.streaming_checkbox = None
         self.thermal_subscriber = None
+        self.fire_laser_button: DebounceButton | None = None
         self.setWindowTitle("Thermal View/Control")
 
         # ---- TOPICS ----
@@ -371,6 +390,11 @@ class ThermalViewControlWidget(BaseTabWidget):
         self.laser_trigger: roslibpy.Service | None = None
         self.laser_set_loop: roslibpy.Service | None = None
 
+        # requests are never mutated, so build them once and reuse them for every call
+        self.empty_request = roslibpy.ServiceRequest()
+        self.loop_on_request = roslibpy.ServiceRequest({'data': True})
+        self.loop_off_request = roslibpy.ServiceRequest({'data': False})
+
     def build(self) -> None:
         """
         Build the GUI layout
@@ -436,8 +460,8 @@ class ThermalViewControlWidget(BaseTabWidget):
         center_gimbal_button = QtWidgets.QPushButton("Center Gimbal")
         joystick_layout.addWidget(center_gimbal_button)
 
-        fire_laser_button = QtWidgets.QPushButton("Laser Fire")
-        joystick_layout.addWidget(fire_laser_button)
+        self.fire_laser_button = DebounceButton("Laser Fire")
+        joystick_layout.addWidget(self.fire_laser_button)
 
         laser_on_button = QtWidgets.QPushButton("Laser On")
         joystick_layout.addWidget(laser_on_button)
@@ -454,26 +478,9 @@ class ThermalViewControlWidget(BaseTabWidget):
         #         lambda: self.joystick.center_gimbal()
         # )
 
-        fire_laser_button.clicked.connect(
-            lambda: self.laser_trigger.call(roslibpy.ServiceRequest(),
-                                            callback=lambda msg: logger.debug(
-                                                'Fire laser result: ' + msg.get('message', '')
-                                            ))
-        )
-
-        laser_on_button.clicked.connect(
-            lambda: self.laser_set_loop.call(roslibpy.ServiceRequest({'data': True}),
-                                             callback=lambda msg: logger.debug(
-                                                 'Set Loop result: ' + msg.get('message', '')
-                                             ))
-        )
-
-        laser_off_button.clicked.connect(
-            lambda: self.laser_set_loop.call(roslibpy.ServiceRequest({'data': False}),
-                                             callback=lambda msg: logger.debug(
-                                                 'Set Loop results: ' + msg.get('message', '')
-                                             ))
-        )
+        self.fire_laser_button.clicked.connect(self.fire_laser)
+        laser_on_button.clicked.connect(lambda: self.set_laser_loop(True))
+        laser_off_button.clicked.connect(lambda: self.set_laser_loop(False))
 
         # kill_button.clicked.connect(
         #         lambda: self.kill()
@@ -501,7 +508,16 @@ class ThermalViewControlWidget(BaseTabWidget):
             'std_srvs/srv/SetBool'
         )
 
-        self.thermal_raw.subscribe(lambda msg: self.viewer.update_canvas(msg['data']))
+        self.thermal_raw.subscribe(self.thermal_raw_callback)
+
+    def thermal_raw_callback(self, msg: dict[str, Any]) -> None:
+        data = msg['data']
+        if isinstance(data, str):
+            # rosbridge sends byte arrays as base64, which can be read without building a list
+            pixels = np.frombuffer(base64.b64decode(data), dtype=np.uint8).astype(np.float32)
+        else:
+            pixels = np.asarray(data, dtype=np.float32)
+        self.viewer.update_canvas(pixels)
 
     def set_controller(self, enabled: bool) -> None:
         self.joystick.controller_enabled = enabled
@@ -518,35 +534,37 @@ class ThermalViewControlWidget(BaseTabWidget):
         x = deadzone(pos[0], 20)
         y = deadzone(pos[1], 20)
         self.joystick.set_pos(
-            map_value(x, -130, 130, 0, 200),
-            map_value(y, -130, 130, 0, 200)
+            (x + 130) * CONTROLLER_SCALE,
+            (y + 130) * CONTROLLER_SCALE
         )
 
-    def on_controller_rt(self, state: bool) -> None:
+    def fire_laser(self) -> None:
+        # the button doubles as the debounce flag, so clicks and controller presses share it
+        if self.laser_trigger is None or not self.fire_laser_button.debounce():
+            return
+
+        self.laser_trigger.call(self.empty_request, callback=self.fire_laser_callback)
+
+    @staticmethod
+    def fire_laser_callback(msg: dict[str, Any]) -> None:
+        logger.debug('Fire laser result: ' + msg.get('message', ''))
+
+    def set_laser_loop(self, state: bool) -> None:
         if self.laser_set_loop is not None:
-            if state:
-                self.laser_set_loop.call(roslibpy.ServiceRequest({'data': True}),
-                                         callback=lambda msg: logger.debug(
-                                             'Set Loop result: ' + msg.get('message', '')
-                                         ))
-            else:
-                self.laser_set_loop.call(roslibpy.ServiceRequest({'data': False}),
-                                         callback=lambda msg: logger.debug(
-                                             'Set Loop result: ' + msg.get('message', '')
-                                         ))
+            self.laser_set_loop.call(
+                self.loop_on_request if state else self.loop_off_request,
+                callback=self.set_laser_loop_callback
+            )
 
-    def on_controller_rb(self) -> None:
-        ms = int(round(time.time() * 1000))
-        timesince = ms - self.last_fire
-        if timesince < 100:
-            return
-        self.last_fire = ms
+    @staticmethod
+    def set_laser_loop_callback(msg: dict[str, Any]) -> None:
+        logger.debug('Set Loop result: ' + msg.get('message', ''))
 
-        if self.laser_trigger is not None:
-            self.laser_trigger.call(roslibpy.ServiceRequest(),
-                                    callback=lambda msg: logger.debug(
-                                        'Fire laser result: ' + msg.get('message', '')
-                                    ))
+    def on_controller_rt(self, state: bool) -> None:
+        self.set_laser_loop(state)
+
+    def on_controller_rb(self) -> None:
+        self.fire_laser()
 
     def on_controller_r3(self) -> None:
         self.relative_checkbox.setChecked(not self.joystick.relative_movement)
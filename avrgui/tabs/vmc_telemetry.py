@@ -1,12 +1,12 @@
 from __future__ import annotations
 
+import functools
 import json
 import time
 from enum import Enum
 from threading import Thread
-from typing import Callable, Any
+from typing import Callable, Any, NamedTuple
 
-import colour
 import roslibpy
 from PySide6 import QtCore, QtWidgets, QtGui
 from bell.avr.mqtt.payloads import (
@@ -22,9 +22,9 @@ from .base import BaseTabWidget
 from .connection.rosbridge import RosBridgeClient
 from ..lib.color import smear_color, wrap_text
 from ..lib.toast import Toast
+from ..lib.timers import CoalesceTimer
 from ..lib.widgets import DisplayLineEdit, StatusLabel
 
-BATTERY_COLORS: list[colour.Color] = colour.Color("green").range_to(colour.Color("red"), 101)
 COLORED_UNKNOWN_TEXT = "<span style='color:orange;'>Unknown</span>"
 UNKNOWN_TEXT = "Unknown"
 RED_COLOR = "red"
@@ -33,10 +33,15 @@ YELLOW_COLOR = "#ffb800"
 GREEN_COLOR = "#1bc700"
 
 NAV_STATE_PREFIX_LENGTH = len('NAVIGATION_STATE_')
+COLORED_ARMED_TEXT = f"<a style='color:{YELLOW_COLOR};'>Armed</a>"
+COLORED_DISARMED_TEXT = f"<a style='color:{GREEN_COLOR};'>Disarmed</a>"
 
 LOW_BATTERY_VOLTAGE = 15.8
 FAULT_BATTERY_VOLTAGE = 14.8
 
+# shortest time between pose readout updates, the zed publishes faster than the screen refreshes
+POSE_INTERVAL_MS = 16
+
 
 class PX4VehicleCommand(Enum):
     VEHICLE_CMD_PREFLIGHT_REBOOT_SHUTDOWN = 246
@@ -76,6 +81,12 @@ class PX4VehicleStatusNavState(Enum):
     NAVIGATION_STATE_MAX = 31
 
 
+NAV_STATE_TEXT = {
+    nav_state: f"<a style='color:{LIGHT_BLUE_COLOR};'>{nav_state.name[NAV_STATE_PREFIX_LENGTH:]}</a>"
+    for nav_state in PX4VehicleStatusNavState
+}
+
+
 class ZEDPositionStatus(Enum):
     SEARCHING = 0
     OK = 1
@@ -84,11 +95,20 @@ class ZEDPositionStatus(Enum):
     SEARCHING_FLOOR_PLANE = 3
 
 
+class RestartRow(NamedTuple):
+    # one service row in the states box, with its restart button
+    key: str
+    name: str
+    callback: Callable[[], None]
+    show_dialog: bool = False
+    title: str = ""
+    message: str = ""
+
+
 class VMCTelemetryWidget(BaseTabWidget):
     # This widget provides a minimal QGroundControl-esque interface.
     # In our case, this operates over MQTT as all the relevant data
     # is already published there.
-    vehicle_state_signal = QtCore.Signal(bool, object)
     battery_state_signal = QtCore.Signal(bool, float, float)
     pose_signal = QtCore.Signal(object, object)
     pose_state_signal = QtCore.Signal(object)
@@ -126,6 +146,15 @@ class VMCTelemetryWidget(BaseTabWidget):
 
         self.battery_level = 0
 
+        # newest pose waiting to be shown, poses that arrive before it's shown replace it
+        self.pending_pose: tuple[tuple[float, float, float], tuple[float, float, float, float]] | None = None
+        self.pose_timer = CoalesceTimer(POSE_INTERVAL_MS, self.show_pending_pose, self)
+
+        # last text set on each label, telemetry repeats a lot so unchanged text isn't set or forwarded again
+        self.battery_text = (COLORED_UNKNOWN_TEXT, '')
+        self.armed_text = COLORED_UNKNOWN_TEXT
+        self.mode_text = COLORED_UNKNOWN_TEXT
+
         self.setWindowTitle("VMC Telemetry")
 
         self.pcc_restart_service: roslibpy.Service | None = None
@@ -136,6 +165,14 @@ class VMCTelemetryWidget(BaseTabWidget):
         self.zed_pose_subscriber: roslibpy.Topic | None = None
         self.zed_pose_state_subscriber: roslibpy.Topic | None = None
 
+        # requests are never mutated, so build them once and reuse them for every call
+        self.empty_request = roslibpy.ServiceRequest()
+        self.enable_servos_request = roslibpy.ServiceRequest({'data': True})
+        self.reboot_command = {
+            'command': PX4VehicleCommand.VEHICLE_CMD_PREFLIGHT_REBOOT_SHUTDOWN.value,
+            'param1': float(1)
+        }
+
     def build(self) -> None:
         """
         Build the GUI layout
@@ -166,19 +203,7 @@ class VMCTelemetryWidget(BaseTabWidget):
         self.battery_current_label = QtWidgets.QLabel("")
         battery_layout.addWidget(self.battery_voltage_label)
         battery_layout.addWidget(self.battery_current_label)
-        self.battery_state_signal.connect(
-            lambda _, voltage, __: self.battery_voltage_label.setText(self.format_battery_voltage(voltage))
-        )
-        self.battery_state_signal.connect(
-            lambda _, __, current: self.battery_current_label.setText(self.format_battery_current(current))
-        )
-
-        self.battery_state_signal.connect(
-            lambda _, voltage, current: self.formatted_battery_signal.emit(
-                self.format_battery_voltage(voltage),
-                self.format_battery_current(current)
-            )
-        )
+        self.formatted_battery_signal.connect(self.set_battery_text, QtCore.Qt.ConnectionType.QueuedConnection)
 
         fcc_layout.addWidget(QtWidgets.QLabel("Battery:"), 0, 0)
         fcc_layout.addLayout(battery_layout, 0, 1)
@@ -187,23 +212,13 @@ class VMCTelemetryWidget(BaseTabWidget):
         self.armed_label = QtWidgets.QLabel(COLORED_UNKNOWN_TEXT)
         fcc_layout.addWidget(QtWidgets.QLabel("Armed Status:"), 1, 0)
         fcc_layout.addWidget(self.armed_label, 1, 1)
-        self.vehicle_state_signal.connect(
-            lambda armed, _: self.armed_label.setText(self.format_armed_text(armed))
-        )
-        self.vehicle_state_signal.connect(
-            lambda armed, _: self.formatted_armed_signal.emit(self.format_armed_text(armed))
-        )
+        self.formatted_armed_signal.connect(self.armed_label.setText, QtCore.Qt.ConnectionType.QueuedConnection)
 
         # flight mode row
         self.flight_mode_label = QtWidgets.QLabel(COLORED_UNKNOWN_TEXT)
         fcc_layout.addWidget(QtWidgets.QLabel("Flight Mode:"), 2, 0)
         fcc_layout.addWidget(self.flight_mode_label, 2, 1)
-        self.vehicle_state_signal.connect(
-            lambda _, nav_state: self.flight_mode_label.setText(self.format_nav_state(nav_state))
-        )
-        self.vehicle_state_signal.connect(
-            lambda _, nav_state: self.formatted_mode_signal.emit(self.format_nav_state(nav_state))
-        )
+        self.formatted_mode_signal.connect(self.flight_mode_label.setText, QtCore.Qt.ConnectionType.QueuedConnection)
 
         top_layout.addWidget(fcc_groupbox)
 
@@ -244,15 +259,7 @@ class VMCTelemetryWidget(BaseTabWidget):
 
         top_layout.addWidget(pose_groupbox)
 
-        def update_pose(position: tuple[float, float, float],
-                        _: tuple[float, float, float, float]) -> None:
-            self.pos_x_line_edit.setText(position[0])
-            self.pos_y_line_edit.setText(position[1])
-            self.pos_z_line_edit.setText(position[2])
-
-            # ToDo: Convert quaternion to rpy and set values
-
-        self.pose_signal.connect(update_pose)
+        self.pose_signal.connect(self.queue_pose, QtCore.Qt.ConnectionType.QueuedConnection)
 
         layout.addWidget(top_group)
 
@@ -268,52 +275,58 @@ class VMCTelemetryWidget(BaseTabWidget):
         self.zed_tracking_status_label = StatusLabel("ZED Tracking")
         states_layout.addWidget(self.zed_tracking_status_label, y, 0)
         self.service_map["zed_tracking"] = self.zed_tracking_status_label.set_health
-        self.pose_state_signal.connect(
-            lambda state: self.zed_tracking_status_label.set_health(state == ZEDPositionStatus.OK)
-        )
+        self.pose_state_signal.connect(self.set_zed_tracking_health, QtCore.Qt.ConnectionType.QueuedConnection)
 
         y += 1
 
-        self.vmc_service_status_label = StatusLabel("ROS2 Launch File")
-        restart_button = QtWidgets.QPushButton("Restart")
-        restart_button.clicked.connect(lambda: self.restart_service(
-            lambda: None  # ToDo: Make this run 'sudo systemctl restart vmc'
-        ))
-        states_layout.addWidget(self.vmc_service_status_label, y, 0)
-        states_layout.addWidget(restart_button, y, 1)
-        self.service_map["vmc_service"] = self.vmc_service_status_label.set_health
+        restart_rows = [
+            RestartRow(
+                key="vmc_service",
+                name="ROS2 Launch File",
+                callback=lambda: None  # ToDo: Make this run 'sudo systemctl restart vmc'
+            ),
+            RestartRow(
+                key="fcc",
+                name="Flight Controller",
+                callback=self.reset_fcm,
+                show_dialog=True,
+                title="Restart Flight Controller",
+                message="This will restart the flight controller.\nIf the drone is currently flying, it will fall."
+            ),
+            RestartRow(
+                key="pcc",
+                name="Peripheral Controller",
+                callback=self.reset_pcc,
+                show_dialog=True,
+                title="Restart Peripheral Controller",
+                message="This will restart the peripheral controller.\nIt may also stop the servos from working."
+            ),
+        ]
+        status_labels: dict[str, StatusLabel] = {}
+        for row in restart_rows:
+            status_label = StatusLabel(row.name)
+            restart_button = QtWidgets.QPushButton("Restart")
+            restart_button.clicked.connect(functools.partial(
+                self.restart_service,
+                row.callback,
+                row.show_dialog,
+                row.title,
+                row.message
+            ))
+            states_layout.addWidget(status_label, y, 0)
+            states_layout.addWidget(restart_button, y, 1)
+            self.service_map[row.key] = status_label.set_health
+            status_labels[row.key] = status_label
+
+            y += 1
+
+        self.vmc_service_status_label = status_labels["vmc_service"]
         self.vmc_service_status_label.set_health(True)
 
-        y += 1
-
-        self.fcm_status_label = StatusLabel("Flight Controller")
-        restart_button = QtWidgets.QPushButton("Restart")
-        restart_button.clicked.connect(lambda: self.restart_service(
-            self.reset_fcm,
-            True,
-            "Restart Flight Controller",
-            "This will restart the flight controller.\nIf the drone is currently flying, it will fall."
-        ))
-        states_layout.addWidget(self.fcm_status_label, y, 0)
-        states_layout.addWidget(restart_button, y, 1)
-        self.service_map["fcc"] = self.fcm_status_label.set_health
-        self.battery_state_signal.connect(lambda connected, voltage, _: self.fcm_status_label.set_health(
-            connected and voltage > FAULT_BATTERY_VOLTAGE
-        ))
-
-        y += 1
+        self.fcm_status_label = status_labels["fcc"]
+        self.battery_state_signal.connect(self.set_fcm_health, QtCore.Qt.ConnectionType.QueuedConnection)
 
-        self.pcm_status_label = StatusLabel("Peripheral Controller")
-        restart_button = QtWidgets.QPushButton("Restart")
-        restart_button.clicked.connect(lambda: self.restart_service(
-            self.reset_pcc,
-            True,
-            "Restart Peripheral Controller"
-            "This will restart the peripheral controller.\nIt may also stop the servos from working."
-        ))
-        states_layout.addWidget(self.pcm_status_label, y, 0)
-        states_layout.addWidget(restart_button, y, 1)
-        self.service_map["pcc"] = self.pcm_status_label.set_health
+        self.pcm_status_label = status_labels["pcc"]
         self.pcm_status_label.set_health(True)
 
         layout.addWidget(states_groupbox)
@@ -329,11 +342,49 @@ class VMCTelemetryWidget(BaseTabWidget):
 
         layout.addWidget(self.main_shutdown_button)
 
+    @QtCore.Slot(str, str)
+    def set_battery_text(self, voltage: str, current: str) -> None:
+        self.battery_voltage_label.setText(voltage)
+        self.battery_current_label.setText(current)
+
+    @QtCore.Slot(object)
+    def set_zed_tracking_health(self, state: ZEDPositionStatus) -> None:
+        self.zed_tracking_status_label.set_health(state == ZEDPositionStatus.OK)
+
+    @QtCore.Slot(bool, float, float)
+    def set_fcm_health(self, connected: bool, voltage: float, _: float) -> None:
+        self.fcm_status_label.set_health(connected and voltage > FAULT_BATTERY_VOLTAGE)
+
+    def queue_pose(self, position: tuple[float, float, float], orientation: tuple[float, float, float, float]) -> None:
+        self.pending_pose = position, orientation
+        self.pose_timer.queue()
+
+    def show_pending_pose(self) -> None:
+        if self.pending_pose is None:
+            return
+        position, _ = self.pending_pose
+        self.pending_pose = None
+
+        self.pos_x_line_edit.setText(position[0])
+        self.pos_y_line_edit.setText(position[1])
+        self.pos_z_line_edit.setText(position[2])
+
+        # ToDo: Convert quaternion to rpy and set values
+
     def status_callback_fcm(self, msg: dict[str, Any]) -> None:
         arming_state = msg['arming_state'] == 2
         nav_state = PX4VehicleStatusNavState(msg['nav_state'])
 
-        self.vehicle_state_signal.emit(arming_state, nav_state)
+        # the label text is built here on the ros thread, the gui thread only sets it
+        armed_text = self.format_armed_text(arming_state)
+        if armed_text != self.armed_text:
+            self.armed_text = armed_text
+            self.formatted_armed_signal.emit(armed_text)
+
+        mode_text = self.format_nav_state(nav_state)
+        if mode_text != self.mode_text:
+            self.mode_text = mode_text
+            self.formatted_mode_signal.emit(mode_text)
 
     def battery_status_callback_fcm(self, msg: dict[str, Any]) -> None:
         connected = msg['connected']
@@ -342,6 +393,11 @@ class VMCTelemetryWidget(BaseTabWidget):
 
         self.battery_state_signal.emit(connected, voltage, current)
 
+        battery_text = self.format_battery_voltage(voltage), self.format_battery_current(current)
+        if battery_text != self.battery_text:
+            self.battery_text = battery_text
+            self.formatted_battery_signal.emit(*battery_text)
+
     def pose_callback_zed(self, msg: dict[str, Any]) -> None:
         pose = msg['pose']
         position_dict = pose['position']
@@ -408,7 +464,7 @@ class VMCTelemetryWidget(BaseTabWidget):
 
     def reset_pcc(self) -> None:
         self.pcc_restart_service.call(
-            roslibpy.ServiceRequest(),
+            self.empty_request,
             lambda msg: print(f'PCC reset triggered: {msg}')
         )
         Thread(target=self.enable_servos_pcc, daemon=True).start()
@@ -416,17 +472,12 @@ class VMCTelemetryWidget(BaseTabWidget):
     def enable_servos_pcc(self) -> None:
         time.sleep(5)
         self.pcc_servo_enable_service.call(
-            roslibpy.ServiceRequest({'data': True}),
+            self.enable_servos_request,
             lambda msg: print(f'PCC servos enabled: {msg}')
         )
 
     def reset_fcm(self) -> None:
-        self.fcm_command_publisher.publish(
-            {
-                'command': PX4VehicleCommand.VEHICLE_CMD_PREFLIGHT_REBOOT_SHUTDOWN.value,
-                'param1': float(1)
-            }
-        )
+        self.fcm_command_publisher.publish(self.reboot_command)
 
     def set_global_position_fcm(self, latitude: float, longitude: float, altitude: float = 0) -> None:
         self.fcm_command_publisher.publish(
@@ -445,17 +496,17 @@ class VMCTelemetryWidget(BaseTabWidget):
 
     def clear(self) -> None:
         # status
-        self.battery_voltage_label.setText(COLORED_UNKNOWN_TEXT)
-        self.battery_current_label.setText('')
+        self.battery_text = (COLORED_UNKNOWN_TEXT, '')
         self.formatted_battery_signal.emit(COLORED_UNKNOWN_TEXT, '')
 
-        self.armed_label.setText(COLORED_UNKNOWN_TEXT)
+        self.armed_text = COLORED_UNKNOWN_TEXT
         self.formatted_armed_signal.emit(COLORED_UNKNOWN_TEXT)
 
-        self.flight_mode_label.setText(COLORED_UNKNOWN_TEXT)
+        self.mode_text = COLORED_UNKNOWN_TEXT
         self.formatted_mode_signal.emit(COLORED_UNKNOWN_TEXT)
 
         # position
+        self.pending_pose = None
         self.pos_x_line_edit.setText(UNKNOWN_TEXT)
         self.pos_y_line_edit.setText(UNKNOWN_TEXT)
         self.pos_z_line_edit.setText(UNKNOWN_TEXT)
@@ -470,15 +521,8 @@ class VMCTelemetryWidget(BaseTabWidget):
             do_reset = True
             if show_dialog:
                 if '\n' in message:
-                    split = message.split('‡')
-                    message = ""
-                    num = 0
-                    for text in split[0:-1]:
-                        message += text
-                        if not num == len(split[0:-1]) - 1:
-                            message += "\n"
-                        num += 1
-                    info = split[-1]
+                    # the last line is shown as the dialog's informative text
+                    message, info = message.rsplit('\n', 1)
                 else:
                     info = None
 
@@ -515,11 +559,10 @@ class VMCTelemetryWidget(BaseTabWidget):
     @staticmethod
     def format_armed_text(armed: bool) -> str:
         if armed:
-            return f"<a style='color:{YELLOW_COLOR};'>Armed</a>"
+            return COLORED_ARMED_TEXT
         else:
-            return f"<a style='color:{GREEN_COLOR};'>Disarmed</a>"
+            return COLORED_DISARMED_TEXT
 
     @staticmethod
     def format_nav_state(nav_state: PX4VehicleStatusNavState) -> str:
-        state = nav_state.name[NAV_STATE_PREFIX_LENGTH:]
-        return f"<a style='color:{LIGHT_BLUE_COLOR};'>{state}</a>"
+        return NAV_STATE_TEXT[nav_state]
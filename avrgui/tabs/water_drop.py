@@ -1,10 +1,12 @@
 import time
+from typing import Any
 
 import roslibpy
 from PySide6 import QtCore, QtWidgets
 from loguru import logger
 
 from ..lib.graphics_view import GraphicsView
+from ..lib.widgets import DebounceButton
 from .base import BaseTabWidget
 from .connection.rosbridge import RosBridgeClient
 
@@ -21,7 +23,7 @@ class WaterDropWidget(BaseTabWidget):
 
         self.last_time = 0
         # self.position_slider: QtWidgets.QSlider | None = None
-        self.trigger_button: QtWidgets.QPushButton | None = None
+        self.trigger_button: DebounceButton | None = None
         self.controller_enabled_checkbox = None
         self.controller_enabled = False
         self.canvas = None
@@ -40,6 +42,7 @@ class WaterDropWidget(BaseTabWidget):
 
         # ---- Services -----
         self.bdu_trigger: roslibpy.Service | None = None
+        self.empty_request = roslibpy.ServiceRequest()
 
     def build(self) -> None:
         layout = QtWidgets.QGridLayout()
@@ -76,7 +79,7 @@ class WaterDropWidget(BaseTabWidget):
         # )
         # controls_layout.addWidget(self.position_slider)
 
-        self.trigger_button = QtWidgets.QPushButton("Trigger")
+        self.trigger_button = DebounceButton("Trigger")
         self.trigger_button.clicked.connect(self.trigger_bpu)
         controls_layout.addWidget(self.trigger_button)
 
@@ -118,9 +121,11 @@ class WaterDropWidget(BaseTabWidget):
         pass
 
     def trigger_bpu(self) -> None:
-        self.bdu_trigger.call(
-            roslibpy.ServiceRequest(),
-            callback=lambda msg: logger.debug(
-                'Bdu trigger result: ' + msg.get('message', '')
-            )
-        )
+        if self.bdu_trigger is None or not self.trigger_button.debounce():
+            return
+
+        self.bdu_trigger.call(self.empty_request, callback=self.bdu_trigger_callback)
+
+    @staticmethod
+    def bdu_trigger_callback(msg: dict[str, Any]) -> None:
+        logger.debug('Bdu trigger result: ' + msg.get('message', ''))
@@ -0,0 +1,24 @@
+import pytest
+
+from avrgui.lib.calc import deadzone
+
+
+@pytest.mark.parametrize("value", [-20, -19.5, 0, 19.5, 20])
+def test_deadzone_zeroes_values_inside_and_on_the_edge(value):
+    assert deadzone(value, 20) == 0
+
+
+@pytest.mark.parametrize("value", [-130, -20.5, 20.5, 130])
+def test_deadzone_passes_values_outside(value):
+    assert deadzone(value, 20) == value
+
+
+def test_deadzone_relative_mode_edges():
+    assert deadzone(-10, 10) == 0
+    assert deadzone(10, 10) == 0
+    assert deadzone(11, 10) == 11
+
+
+def test_deadzone_keeps_number_type():
+    assert type(deadzone(5, 10)) is int
+    assert type(deadzone(5.0, 10)) is float